@@ -9,14 +9,20 @@ import logging
 import sys
 import json
 import time
+import threading
+import random
+import hashlib
 try:
     import signal
 except ImportError:
     signal = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from contextlib import contextmanager
 from dotenv import load_dotenv
 from email_validator import validate_email, EmailNotValidError
-from markdown import markdown as render_markdown
 
 # Load environment variables
 load_dotenv()
@@ -26,10 +32,18 @@ def setup_logging():
     """Configure application logging with JSON format for BetterStack compatibility"""
     log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
     
+    # Log timestamps have second precision, so cache the formatted string and
+    # only re-run strftime when the second actually changes
+    last_ts = [0, '']
+
     # Custom JSON formatter function
     def json_formatter(record):
+        created = int(record.created)
+        if created != last_ts[0]:
+            last_ts[0] = created
+            last_ts[1] = datetime.fromtimestamp(created).strftime('%Y-%m-%d %H:%M:%S')
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': last_ts[1],
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage()
@@ -109,6 +123,20 @@ logger = setup_logging()
 # Create Flask app
 app = Flask(__name__)
 
+# Serialize JSON responses with orjson when available - its compiled encoder
+# is several times faster than the stdlib json behind Flask's default provider
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class ORJSONProvider(DefaultJSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
 # Add startup logging with proper levels
 logger.info("Starting Job Sight application...")
 logger.info(f"Environment: {os.environ.get('FLASK_ENV', 'unknown')}")
@@ -161,6 +189,7 @@ def before_request():
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///job_sight.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False #Setting it to False inceases performance, it tracks changes to objects
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 86400 #Let browsers cache static assets (CSS, icons) for a day
 
 # Initialize extensions
 db = SQLAlchemy(app) #Creates database connection object using the Flask app
@@ -204,72 +233,332 @@ class SavedJob(db.Model):
     job_title = db.Column(db.String(255), nullable=False)
     company = db.Column(db.String(255), nullable=False)
     location = db.Column(db.String(255), nullable=False)
-    salary_min = db.Column(db.Numeric(10, 2), nullable=True)
-    salary_max = db.Column(db.Numeric(10, 2), nullable=True)
+    # Stored as integer pence - plain ints load and format far faster than
+    # the Decimal objects a Numeric column would produce
+    salary_min = db.Column(db.Integer, nullable=True)
+    salary_max = db.Column(db.Integer, nullable=True)
     job_url = db.Column(db.Text, nullable=False)
     description = db.Column(db.Text, nullable=True)
     saved_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     __table_args__ = (db.UniqueConstraint('user_id', 'job_id', name='unique_user_job'),)
 
+    def get_salary_range(self):
+        """Return the formatted salary range, memoized per instance.
+
+        Called once per row when rendering the saved jobs list; the
+        Decimal-to-string conversion is slow enough to be worth caching
+        so repeated accesses within a request are a dict lookup.
+        """
+        cached = self.__dict__.get('_salary_range')
+        if cached is None:
+            if self.salary_min and self.salary_max:
+                cached = f"£{self.salary_min // 100:,} - £{self.salary_max // 100:,}"
+            elif self.salary_min:
+                cached = f"£{self.salary_min // 100:,}+"
+            elif self.salary_max:
+                cached = f"Up to £{self.salary_max // 100:,}"
+            else:
+                cached = ''
+            self.__dict__['_salary_range'] = cached
+        return cached
+
+    @classmethod
+    def upsert_ignore(cls, **fields):
+        """Insert a saved job, silently skipping duplicates.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING on the (user_id, job_id)
+        unique constraint so the save path is a single atomic round-trip
+        instead of a SELECT followed by an INSERT. Returns True if a row
+        was inserted, False if the job was already saved.
+        """
+        if db.engine.dialect.name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(cls).values(**fields)\
+            .on_conflict_do_nothing(index_elements=['user_id', 'job_id'])
+        result = db.session.execute(stmt)
+        db.session.commit()
+        return result.rowcount > 0
+
+# Prebuilt existence probes for registration - constructed once at import so
+# the hot validator path skips ORM query construction and hits the driver's
+# statement cache deterministically
+from sqlalchemy import select, bindparam, literal
+# Usernames are stored lowercase (scripts/backfill_lowercase_usernames.py
+# normalizes pre-existing rows), so the plain comparison hits the unique index
+_USERNAME_EXISTS = select(literal(1)).where(User.username == bindparam('u')).limit(1)
+_EMAIL_EXISTS = select(literal(1)).where(User.email == bindparam('e')).limit(1)
+
+def _to_pence(value):
+    """Convert a pounds amount from the API (float/str) to integer pence."""
+    if value in (None, ''):
+        return None
+    try:
+        return int(round(float(value) * 100))
+    except (TypeError, ValueError):
+        return None
+
+class SearchHistory(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    job_title = db.Column(db.String(255), nullable=False)
+    location = db.Column(db.String(255), nullable=False)
+    search_date = db.Column(db.DateTime, default=datetime.utcnow)
+
+# Search analytics rows are buffered in-process and written in one
+# bulk_insert_mappings call, so the search hot path does not pay a full
+# INSERT round-trip per request. Losing a partial batch on crash is
+# acceptable for analytics data.
+_SEARCH_LOG_BATCH = 25
+_SEARCH_LOG_MAX_AGE = 30  # seconds
+_search_log_buffer = []
+_search_log_lock = threading.Lock()
+_search_log_last_flush = time.monotonic()
+_search_table_ready = False
+
+def _ensure_search_table():
+    """Create the search_history table on first use if it is missing.
+
+    db.create_all() only runs under __main__, so a gunicorn deployment
+    against an existing database would otherwise never gain the table.
+    """
+    global _search_table_ready
+    if not _search_table_ready:
+        SearchHistory.__table__.create(bind=db.engine, checkfirst=True)
+        _search_table_ready = True
+
+def record_search(job_title, location):
+    """Buffer a search for analytics and bulk-flush when the batch fills or ages out."""
+    global _search_log_last_flush
+    row = {
+        'job_title': job_title,
+        'location': location,
+        'search_date': datetime.utcnow()
+    }
+    # Threaded workers append concurrently - drain the buffer under a lock
+    # so batches are neither dropped nor flushed twice
+    with _search_log_lock:
+        _search_log_buffer.append(row)
+        now = time.monotonic()
+        if len(_search_log_buffer) < _SEARCH_LOG_BATCH and now - _search_log_last_flush < _SEARCH_LOG_MAX_AGE:
+            return
+        rows = _search_log_buffer[:]
+        del _search_log_buffer[:]
+        _search_log_last_flush = now
+    try:
+        _ensure_search_table()
+        db.session.bulk_insert_mappings(SearchHistory, rows)
+        db.session.commit()
+        logger.debug("Flushed %d search history rows", len(rows))
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Failed to flush search history batch: {str(e)}")
+
 @login_manager.user_loader
 def load_user(user_id):
     return User.query.get(int(user_id))
 
+# Minimal in-process TTL cache for upstream API responses. Entries expire
+# after `ttl` seconds; when the cache fills it is cleared wholesale, which is
+# adequate for the small number of distinct queries each worker sees.
+class TTLCache:
+    def __init__(self, maxsize=128, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        # Threaded workers share each cache instance; the lock keeps the
+        # expiry delete and the size check from racing between threads
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires < time.monotonic():
+                self._data.pop(key, None)
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                self._data.clear()
+            self._data[key] = (value, time.monotonic() + self.ttl)
+
+# AI summaries are expensive (up to 30s upstream) and identical queries within
+# a few minutes produce near-identical answers, so cache per (title, location)
+_summary_cache = TTLCache(maxsize=64, ttl=300)
+
+# Search results change slowly relative to how often popular queries repeat,
+# so identical (title, location, page) searches within 5 minutes skip Adzuna
+_search_cache = TTLCache(maxsize=256, ttl=300)
+
+# Single-flight bookkeeping so concurrent identical searches (threaded
+# gunicorn workers) trigger one upstream call; the rest wait for its result
+_search_inflight = {}
+_search_inflight_lock = threading.Lock()
+
+# Prebuilt fallback for malformed entries so the error path copies one
+# template instead of allocating a fresh literal per bad record
+_INVALID_JOB = {
+    'id': '',
+    'title': 'Invalid job data',
+    'company': 'Unknown Company',
+    'location': 'Unknown Location',
+    'description': '',
+    'salary_min': None,
+    'salary_max': None,
+    'redirect_url': '',
+    'created': ''
+}
+
+def _format_job(job):
+    """Flatten one raw Adzuna job dict into the shape the templates expect.
+
+    Module-level rather than a method so the hot response loop pays a plain
+    function call per job instead of a bound-method lookup.
+    """
+    if not isinstance(job, dict):
+        return dict(_INVALID_JOB)
+    # EAFP: the nested dicts are present on virtually every job, so the
+    # chained subscripts are cheaper than guarding each level up front
+    try:
+        company = job['company']['display_name']
+    except (KeyError, TypeError):
+        company = 'Unknown Company'
+    try:
+        location = job['location']['display_name']
+    except (KeyError, TypeError):
+        location = 'Unknown Location'
+    return {
+        'id': job.get('id', ''),
+        'title': job.get('title', 'No title'),
+        'company': company,
+        'location': location,
+        'description': job.get('description', 'No description'),
+        'salary_min': job.get('salary_min'),
+        'salary_max': job.get('salary_max'),
+        'redirect_url': job.get('redirect_url', ''),
+        'created': job.get('created', '')
+    }
+
+# Dispatch table for salary badges - the index is (has_min << 1) | has_max,
+# so format_salary picks the right shape without an if/elif ladder
+_SALARY_FMT = (
+    lambda mn, mx: '',
+    lambda mn, mx: f"Up to £{mx:,.0f}",
+    lambda mn, mx: f"£{mn:,.0f}+",
+    lambda mn, mx: f"£{mn:,.0f} - £{mx:,.0f}",
+)
+
+@app.template_global()
+def format_salary(salary_min, salary_max):
+    """Format a salary badge from raw API values (pounds)."""
+    idx = (1 if salary_min else 0) << 1 | (1 if salary_max else 0)
+    return _SALARY_FMT[idx](salary_min, salary_max)
+
+# Shared HTTP session so calls to Adzuna and Azure reuse pooled keep-alive
+# connections instead of paying a TCP+TLS handshake on every request
+http_session = requests.Session()
+http_session.headers.update({
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate'
+})
+# Transparently retry idempotent GETs on transient upstream failures with
+# exponential backoff; POSTs (the Azure call) are deliberately excluded
+from urllib3.util.retry import Retry
+_http_retry = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=True
+)
+_http_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                              max_retries=_http_retry)
+http_session.mount('https://', _http_adapter)
+http_session.mount('http://', _http_adapter)
+
 # Simple API Services
 class JobAPI:
     def __init__(self):
         self.app_id = os.environ.get('ADZUNA_APP_ID')
         self.app_key = os.environ.get('ADZUNA_APP_KEY')
         self.base_url = 'https://api.adzuna.com/v1/api/jobs'
+        # Credentials cannot change at runtime - evaluate once here instead
+        # of building a list for all() on every call
+        self._has_creds = bool(self.app_id) and bool(self.app_key)
+        # Fixed per process, so build the search URL prefix once instead of
+        # re-running the f-string machinery on every call
+        self._search_prefix = f"{self.base_url}/gb/search/"
+        # Auth and sort never vary per call; merge this template with the
+        # per-query fields instead of rebuilding the full params dict
+        self._base_params = {
+            'app_id': self.app_id,
+            'app_key': self.app_key,
+            'results_per_page': 20,
+            'sort_by': 'relevance'
+        }
 
     def search_jobs(self, job_title, location, page=1):
-        if not all([self.app_id, self.app_key]):
+        if not self._has_creds:
             logger.error("Adzuna API credentials not configured - missing app_id or app_key")
             return {'error': 'API credentials not configured', 'results': [], 'count': 0}
 
+        cache_key = (job_title.lower().strip(), location.lower().strip(), page)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Search cache hit for '{job_title}' in '{location}' (page {page})")
+            return cached
+
+        # If another thread is already fetching this exact query, wait for
+        # its result instead of duplicating the API call
+        with _search_inflight_lock:
+            event = _search_inflight.get(cache_key)
+            leader = event is None
+            if leader:
+                event = threading.Event()
+                _search_inflight[cache_key] = event
+        if not leader:
+            event.wait(timeout=11)
+            cached = _search_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            # Leader failed or timed out - fall through and fetch directly
+
         logger.info(f"Searching jobs: '{job_title}' in '{location}' (page {page})")
-        
+
         try:
-            url = f"{self.base_url}/gb/search/{page}"
-            params = {
-                'app_id': self.app_id,
-                'app_key': self.app_key,
-                'what': job_title,
-                'where': location,
-                'results_per_page': 20,
-                'sort_by': 'relevance'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
+            url = self._search_prefix + str(page)
+            params = {**self._base_params, 'what': job_title, 'where': location}
+
+            response = http_session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            # orjson parses straight from the response bytes, skipping the
+            # str decode and the slower stdlib parser
+            if orjson is not None:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
             
             job_count = data.get('count', 0)
             logger.info(f"Successfully fetched {job_count} jobs from Adzuna API")
             
-            formatted_jobs = []
-            for job in data.get('results', []):
-                formatted_job = {
-                    'id': job.get('id', ''),
-                    'title': job.get('title', 'No title'),
-                    'company': job.get('company', {}).get('display_name', 'Unknown Company'),
-                    'location': job.get('location', {}).get('display_name', 'Unknown Location'),
-                    'description': job.get('description', 'No description'),
-                    'salary_min': job.get('salary_min'),
-                    'salary_max': job.get('salary_max'),
-                    'redirect_url': job.get('redirect_url', ''),
-                    'created': job.get('created', '')
-                }
-                formatted_jobs.append(formatted_job)
-            
-            return {
+            fmt = _format_job
+            formatted_jobs = [fmt(job) for job in data.get('results', [])]
+
+            search_results = {
                 'results': formatted_jobs,
                 'count': job_count,
                 'page': page,
                 'total_pages': (job_count + 19) // 20
             }
-            
+            _search_cache.set(cache_key, search_results)
+            return search_results
+
         except requests.exceptions.Timeout:
             logger.error(f"Timeout error when fetching jobs for '{job_title}' in '{location}'")
             return {'error': 'Request timeout - please try again', 'results': [], 'count': 0}
@@ -279,49 +568,108 @@ class JobAPI:
         except Exception as e:
             logger.error(f"Unexpected error in job search: {str(e)}")
             return {'error': 'Failed to fetch jobs due to unexpected error', 'results': [], 'count': 0}
+        finally:
+            if leader:
+                with _search_inflight_lock:
+                    _search_inflight.pop(cache_key, None)
+                event.set()
+
+# Prompt text is parsed once at import; per call only the dynamic fields are
+# substituted via format_map instead of rebuilding the whole literal
+# Static instructions lead and the per-query data trails so every request
+# shares the same prompt prefix, letting Azure's prompt caching reuse it
+_MARKET_PROMPT = """
+            Analyze the job market for the position and location given below.
+
+            Provide a concise market summary covering:
+            1. Market demand and competition level
+            2. Salary expectations
+            3. Key insights for recruiters
+
+            Keep response under 300 words.
+
+            Position: "{job_title}" in "{location}"
+            Total jobs found: {job_count}
+            Top companies: {top_companies}
+            {salary_info}
+            """
+
+_SYSTEM_MESSAGE = "You are a recruitment analyst providing market insights."
 
 class AIService:
+    __slots__ = ('endpoint', 'api_key', '_configured')
+
     def __init__(self):
         self.endpoint = os.environ.get('AZURE_AI_ENDPOINT')
         self.api_key = os.environ.get('AZURE_AI_KEY')
+        self._configured = bool(self.endpoint and self.api_key)
 
     def generate_summary(self, job_title, location, job_results):
-        if not all([self.endpoint, self.api_key]):
+        if not self._configured:
             logger.warning("Azure AI service not configured - missing endpoint or API key")
             return {'summary': 'AI service not configured', 'error': True}
 
-        logger.info(f"Generating AI summary for '{job_title}' in '{location}' with {len(job_results)} jobs")
-        
+        # Bound the user-controlled fields before they reach the cache key or
+        # the prompt - a pathological query string should not inflate either
+        if not isinstance(job_title, str) or not isinstance(location, str):
+            return {'summary': 'Unable to generate summary at this time.', 'error': True}
+        job_title = job_title.strip()[:100]
+        location = location.strip()[:100]
+        if not job_title or not location or not job_results:
+            return {'summary': 'Unable to generate summary at this time.', 'error': True}
+
+        # Hash the raw inputs up front - the job ids pin the result set - so
+        # a cache hit returns before any aggregation or prompt-building work
+        raw_key = '|'.join([job_title.lower(), location.lower()] +
+                           [str(job.get('id', '')) for job in job_results])
+        cache_key = hashlib.sha256(raw_key.encode()).hexdigest()
+        cached = _summary_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"AI summary cache hit for '{job_title}' in '{location}'")
+            return cached
+
         try:
-            # Prepare job data for AI
-            companies = list(set([job.get('company', '') for job in job_results[:10] if job.get('company')]))
-            salary_data = [job for job in job_results if job.get('salary_min') or job.get('salary_max')]
-            
-            if salary_data:
-                avg_min = sum(job.get('salary_min', 0) for job in salary_data) / len(salary_data)
-                avg_max = sum(job.get('salary_max', 0) for job in salary_data) / len(salary_data)
+            # Prepare job data for AI - a single pass accumulates the deduped
+            # company list (insertion-ordered via dict keys) and the salary
+            # sums together, instead of three comprehensions plus two sum()
+            # scans over intermediate lists
+            companies = {}
+            salary_count = 0
+            salary_min_total = 0
+            salary_max_total = 0
+            for i, job in enumerate(job_results):
+                if i < 10:
+                    company = job.get('company')
+                    if company:
+                        companies[company] = None
+                smin = job.get('salary_min')
+                smax = job.get('salary_max')
+                if smin or smax:
+                    salary_count += 1
+                    salary_min_total += smin or 0
+                    salary_max_total += smax or 0
+            companies = list(companies)
+
+            if salary_count:
+                avg_min = salary_min_total / salary_count
+                avg_max = salary_max_total / salary_count
                 salary_info = f"Average salary range: £{avg_min:,.0f} - £{avg_max:,.0f}"
             else:
                 salary_info = "Salary information not available"
 
-            prompt = f"""
-            Analyze the job market for "{job_title}" positions in "{location}":
-            
-            Total jobs found: {len(job_results)}
-            Top companies: {', '.join(companies[:5]) if companies else 'Various companies'}
-            {salary_info}
-            
-            Provide a concise market summary covering:
-            1. Market demand and competition level
-            2. Salary expectations
-            3. Key insights for recruiters
-            
-            Keep response under 300 words.
-            """
+            prompt = _MARKET_PROMPT.format_map({
+                'job_title': job_title,
+                'location': location,
+                'job_count': len(job_results),
+                'top_companies': ', '.join(companies[:5]) if companies else 'Various companies',
+                'salary_info': salary_info
+            })
+
+            logger.info(f"Generating AI summary for '{job_title}' in '{location}' with {len(job_results)} jobs")
 
             payload = {
                 "messages": [
-                    {"role": "system", "content": "You are a recruitment analyst providing market insights."},
+                    {"role": "system", "content": _SYSTEM_MESSAGE},
                     {"role": "user", "content": prompt}
                 ],
                 "max_tokens": 400,
@@ -333,14 +681,40 @@ class AIService:
                 "api-key": self.api_key
             }
 
-            response = requests.post(self.endpoint, headers=headers, json=payload, timeout=30)
+            # Serialize the payload and parse the reply with orjson when
+            # available rather than the stdlib encoder requests would use
+            if orjson is not None:
+                body = orjson.dumps(payload)
+            else:
+                body = json.dumps(payload).encode()
+            # The shared adapter only retries GETs, so handle Azure throttle
+            # storms here: back off and retry on 429/5xx instead of failing
+            # the summary outright
+            for attempt in range(3):
+                response = http_session.post(self.endpoint, headers=headers, data=body, timeout=30)
+                if response.status_code not in (429, 500, 502, 503, 504) or attempt == 2:
+                    break
+                try:
+                    delay = float(response.headers.get('Retry-After', ''))
+                except ValueError:
+                    delay = 2 ** attempt * 0.5 + random.random() * 0.1
+                # Cap the upstream's Retry-After - a large value would stall
+                # the worker past the gunicorn request timeout
+                delay = min(delay, 5.0)
+                logger.warning(f"Azure AI returned {response.status_code}, retrying in {delay:.1f}s")
+                time.sleep(delay)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content) if orjson is not None else response.json()
             
+            # Imported lazily - only the AI summary path needs markdown, so
+            # workers that never render a summary skip the import at startup
+            from markdown import markdown as render_markdown
             summary_markdown = result['choices'][0]['message']['content'].strip()
             summary_html = render_markdown(summary_markdown, extensions=['extra'])
             logger.info("Successfully generated AI summary")
-            return {'summary': summary_html, 'error': False, 'job_count': len(job_results)}
+            summary = {'summary': summary_html, 'error': False, 'job_count': len(job_results)}
+            _summary_cache.set(cache_key, summary)
+            return summary
             
         except requests.exceptions.Timeout:
             logger.error(f"Timeout error when generating AI summary for '{job_title}' in '{location}'")
@@ -352,6 +726,11 @@ class AIService:
             logger.error(f"Unexpected error in AI summary generation: {str(e)}")
             return {'summary': 'Unable to generate summary at this time.', 'error': True}
 
+# Module-level service instances - constructing these reads environment
+# variables, so do it once at import instead of on every search request
+job_api = JobAPI()
+ai_service = AIService()
+
 # Routes
 @app.route('/health')
 def health_check():
@@ -411,22 +790,21 @@ def search_jobs():
             return render_template('index.html')
         
         # Search for jobs
-        job_api = JobAPI()
         search_results = job_api.search_jobs(job_title, location, page)
-        
+        record_search(job_title, location)
+
         # Generate AI summary
         ai_summary = None
         if search_results.get('results') and not search_results.get('error'):
-            ai_service = AIService()
             ai_summary = ai_service.generate_summary(job_title, location, search_results['results'])
-        
+
         return render_template('results.html',
                              search_results=search_results,
                              ai_summary=ai_summary,
                              job_title=job_title,
                              location=location,
                              page=page)
-    
+
     # Handle GET requests (for popular search links)
     job_title = request.args.get('job_title', '').strip()
     location = request.args.get('location', '').strip()
@@ -434,13 +812,12 @@ def search_jobs():
     
     if job_title and location:
         # Search for jobs
-        job_api = JobAPI()
         search_results = job_api.search_jobs(job_title, location, page)
-        
+        record_search(job_title, location)
+
         # Generate AI summary
         ai_summary = None
         if search_results.get('results') and not search_results.get('error'):
-            ai_service = AIService()
             ai_summary = ai_service.generate_summary(job_title, location, search_results['results'])
         
         return render_template('results.html',
@@ -457,33 +834,24 @@ def search_jobs():
 def save_job():
     try:
         job_data = request.get_json()
-        
-        # Check if job already saved
-        existing_job = SavedJob.query.filter_by(
-            user_id=current_user.id,
-            job_id=job_data['job_id']
-        ).first()
-        
-        if existing_job:
-            logger.debug(f"User {current_user.username} attempted to save already saved job {job_data['job_id']}")
-            return jsonify({'success': False, 'message': 'Job already saved'})
-        
-        # Save new job
-        saved_job = SavedJob(
+
+        # Atomic insert - the unique constraint handles duplicates in one round-trip
+        inserted = SavedJob.upsert_ignore(
             user_id=current_user.id,
             job_id=job_data['job_id'],
             job_title=job_data['job_title'],
             company=job_data['company'],
             location=job_data['location'],
-            salary_min=job_data.get('salary_min'),
-            salary_max=job_data.get('salary_max'),
+            salary_min=_to_pence(job_data.get('salary_min')),
+            salary_max=_to_pence(job_data.get('salary_max')),
             job_url=job_data['job_url'],
             description=job_data.get('description', '')
         )
-        
-        db.session.add(saved_job)
-        db.session.commit()
-        
+
+        if not inserted:
+            logger.debug(f"User {current_user.username} attempted to save already saved job {job_data['job_id']}")
+            return jsonify({'success': False, 'message': 'Job already saved'})
+
         logger.info(f"User {current_user.username} saved job: {job_data['job_title']} at {job_data['company']}")
         return jsonify({'success': True, 'message': 'Job saved successfully'})
         
@@ -522,7 +890,13 @@ def unsave_job():
 @login_required
 def saved_jobs():
     page = request.args.get('page', 1, type=int)
+    # Hydrate only the columns the template renders to keep per-row overhead down
+    from sqlalchemy.orm import load_only
     saved_jobs = SavedJob.query.filter_by(user_id=current_user.id)\
+                              .options(load_only(
+                                  SavedJob.job_id, SavedJob.job_title, SavedJob.company,
+                                  SavedJob.location, SavedJob.salary_min, SavedJob.salary_max,
+                                  SavedJob.job_url, SavedJob.description, SavedJob.saved_at))\
                               .order_by(SavedJob.saved_at.desc())\
                               .paginate(page=page, per_page=20, error_out=False)
     return render_template('saved_jobs.html', saved_jobs=saved_jobs)
@@ -544,7 +918,11 @@ def register():
         if not all([username, email, first_name, last_name, password, password2]):
             flash('All fields are required', 'error')
             return render_template('auth/register.html')
-        
+
+        # Store usernames lowercased so the unique index is effectively
+        # case-insensitive ("Alice" and "alice" are the same account)
+        username = username.strip().lower()
+
         # Validate email format
         try:
             valid_email = validate_email(email)
@@ -562,11 +940,11 @@ def register():
             return render_template('auth/register.html')
         
         # Check if user exists
-        if User.query.filter_by(username=username).first():
+        if db.session.execute(_USERNAME_EXISTS, {'u': username}).first():
             flash('Username already exists', 'error')
             return render_template('auth/register.html')
-        
-        if User.query.filter_by(email=email).first():
+
+        if db.session.execute(_EMAIL_EXISTS, {'e': email}).first():
             flash('Email already registered', 'error')
             return render_template('auth/register.html')
         
@@ -603,7 +981,7 @@ def login():
             flash('Please enter both username and password', 'error')
             return render_template('auth/login.html')
         
-        user = User.query.filter_by(username=username).first()
+        user = User.query.filter_by(username=username.strip().lower()).first()
         if user and user.check_password(password):
             login_user(user)
             next_page = request.args.get('next')
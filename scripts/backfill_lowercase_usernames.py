@@ -0,0 +1,49 @@
+"""
+One-off migration: lowercase pre-existing mixed-case usernames.
+
+Usernames are now stored and looked up lowercase, so accounts created
+before that change must be normalized or their owners can no longer log
+in. Run once after deploying the lowercase change:
+
+    python scripts/backfill_lowercase_usernames.py
+
+If two rows would collapse to the same lowercase name (e.g. "Alice" and
+"alice"), the older account keeps the name and the clash is reported for
+manual resolution rather than guessed at. The script is idempotent -
+already-lowercase rows are untouched.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func
+
+from app import app, db, User
+
+
+def migrate():
+    with app.app_context():
+        mixed = User.query.filter(User.username != func.lower(User.username))\
+            .order_by(User.id).all()
+        if not mixed:
+            print("all usernames already lowercase - nothing to do")
+            return
+        renamed = 0
+        for user in mixed:
+            lowered = user.username.lower()
+            clash = User.query.filter(func.lower(User.username) == lowered,
+                                      User.id != user.id).first()
+            if clash is not None:
+                print(f"SKIPPED user id={user.id} ({user.username!r}): "
+                      f"id={clash.id} already owns {lowered!r} - resolve manually")
+                continue
+            user.username = lowered
+            renamed += 1
+        db.session.commit()
+        print(f"lowercased {renamed} of {len(mixed)} mixed-case usernames")
+
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,51 @@
+"""
+One-off migration: convert SavedJob salaries from pounds to integer pence.
+
+Run once against any database created before salaries were stored as
+integer pence, after deploying that change and before serving traffic:
+
+    python scripts/migrate_salary_to_pence.py
+
+On PostgreSQL this also alters the columns from NUMERIC to INTEGER so
+rows hydrate as plain ints rather than Decimals. Running it twice would
+multiply values by 100 again, so it refuses to run when the PostgreSQL
+columns are already INTEGER; on SQLite there is no stored type to check,
+so only run it once.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect, text
+
+from app import app, db
+
+
+def migrate():
+    with app.app_context():
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            columns = {c['name']: c for c in inspect(db.engine).get_columns('saved_job')}
+            if 'INTEGER' in str(columns['salary_min']['type']).upper():
+                print("salary columns are already INTEGER - nothing to do")
+                return
+            with db.engine.begin() as conn:
+                for col in ('salary_min', 'salary_max'):
+                    conn.execute(text(
+                        f"ALTER TABLE saved_job ALTER COLUMN {col} TYPE integer "
+                        f"USING round({col} * 100)::integer"
+                    ))
+        else:
+            with db.engine.begin() as conn:
+                for col in ('salary_min', 'salary_max'):
+                    conn.execute(text(
+                        f"UPDATE saved_job SET {col} = CAST(ROUND({col} * 100) AS INTEGER) "
+                        f"WHERE {col} IS NOT NULL"
+                    ))
+        print("salary columns migrated to integer pence")
+
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,48 @@
+"""
+Shared pytest fixtures for the Job Sight test suite.
+"""
+
+import os
+
+import pytest
+
+# Point the app at an in-memory database before any test imports it - the
+# suite never needs a real schema, and this keeps SQLite file I/O (and the
+# stray instance/job_sight.db artifact) out of test runs
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+
+
+@pytest.fixture(scope='session')
+def client():
+    """A single test client shared across the whole test session.
+
+    The app under test is a module-level singleton with no per-test state
+    to isolate, so building one client here avoids repeating the
+    environment setup and client construction in every request test.
+    """
+    # Disable IP restrictions once for all request tests
+    os.environ['ENABLE_IP_RESTRICTIONS'] = 'false'
+    os.environ['ALLOWED_IPS'] = ''
+
+    from app import app
+
+    with app.test_client() as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope='session')
+def repo_files():
+    """Relative paths of checked-in files, gathered in one sweep.
+
+    The layout tests previously stat()ed each expected file individually;
+    walking the relevant directories once and sharing the result turns
+    those checks into set lookups.
+    """
+    found = set()
+    for root in ('static', 'templates', '.github'):
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                found.add(os.path.join(dirpath, name))
+    with os.scandir('.') as entries:
+        found.update(entry.name for entry in entries if entry.is_file())
+    return found
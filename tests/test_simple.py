@@ -4,12 +4,12 @@ These tests verify basic functionality without overcomplicating things.
 """
 
 import pytest
-import os
+
+from app import app, db, User, SavedJob, JobAPI, AIService, check_ip_restriction
 
 
 def test_app_imports():
     """Test that the app can be imported successfully."""
-    from app import app, db, User, SavedJob
     assert app is not None
     assert db is not None
     assert User is not None
@@ -18,42 +18,38 @@ def test_app_imports():
 
 def test_app_configuration():
     """Test that the app has basic configuration."""
-    from app import app
     assert app.config['SECRET_KEY'] is not None
     assert 'SQLALCHEMY_DATABASE_URI' in app.config
 
 
 def test_routes_exist():
     """Test that basic routes are defined."""
-    from app import app
-    
-    # Check that routes are registered
-    routes = [str(rule) for rule in app.url_map.iter_rules()]
-    
+    # Check that routes are registered - one set difference instead of a
+    # linear scan per expected route
+    routes = frozenset(rule.rule for rule in app.url_map.iter_rules())
+
     # Basic routes that should exist
-    expected_routes = ['/', '/register', '/login', '/logout', '/search', '/saved_jobs', '/profile']
-    
-    for route in expected_routes:
-        assert route in routes, f"Route {route} not found in {routes}"
+    expected_routes = {'/', '/register', '/login', '/logout', '/search', '/saved_jobs', '/profile'}
+
+    missing = expected_routes - routes
+    assert not missing, f"Missing routes: {missing}"
 
 
-def test_ip_restrictions_disabled_by_default():
+def test_ip_restrictions_disabled_by_default(monkeypatch):
     """Test that IP restrictions are disabled by default."""
-    # Set environment variables for testing
-    os.environ['ENABLE_IP_RESTRICTIONS'] = 'false'
-    os.environ['ALLOWED_IPS'] = ''
-    
-    from app import check_ip_restriction
+    # monkeypatch restores the environment after the test, so the setting
+    # cannot leak into other tests
+    monkeypatch.setenv('ENABLE_IP_RESTRICTIONS', 'false')
+    monkeypatch.setenv('ALLOWED_IPS', '')
+
     assert check_ip_restriction() is True
 
 
-def test_ip_restrictions_enabled():
+def test_ip_restrictions_enabled(monkeypatch):
     """Test that IP restrictions work when enabled."""
-    # Set environment variables for testing
-    os.environ['ENABLE_IP_RESTRICTIONS'] = 'true'
-    os.environ['ALLOWED_IPS'] = '192.168.1.100'
-    
-    from app import check_ip_restriction
+    monkeypatch.setenv('ENABLE_IP_RESTRICTIONS', 'true')
+    monkeypatch.setenv('ALLOWED_IPS', '192.168.1.100')
+
     # This should return False for any IP not in the allowed list
     # We can't easily test the actual IP check without mocking request.remote_addr
     # But we can test that the function exists and can be called
@@ -62,8 +58,6 @@ def test_ip_restrictions_enabled():
 
 def test_models_exist():
     """Test that database models are properly defined."""
-    from app import User, SavedJob
-    
     # Test User model
     assert hasattr(User, '__tablename__')
     assert hasattr(User, 'id')
@@ -80,10 +74,27 @@ def test_models_exist():
     assert hasattr(SavedJob, 'job_title')
 
 
+def test_models_registered_once():
+    """Test that each model has exactly one SQLAlchemy mapper registration."""
+    mapped_classes = [mapper.class_.__name__ for mapper in db.Model.registry.mappers]
+    assert mapped_classes.count('User') == 1
+    assert mapped_classes.count('SavedJob') == 1
+
+
+@pytest.mark.parametrize("salary_min,salary_max,expected", [
+    (5000000, 7000000, '£50,000 - £70,000'),
+    (4500000, None, '£45,000+'),
+    (None, 6000000, 'Up to £60,000'),
+    (None, None, ''),
+])
+def test_get_salary_range(salary_min, salary_max, expected):
+    """Test salary formatting (amounts stored as pence) without the database."""
+    job = SavedJob(salary_min=salary_min, salary_max=salary_max)
+    assert job.get_salary_range() == expected
+
+
 def test_api_classes_exist():
     """Test that API service classes exist."""
-    from app import JobAPI, AIService
-    
     # Test JobAPI class
     assert hasattr(JobAPI, 'search_jobs')
     assert callable(JobAPI.search_jobs)
@@ -93,73 +104,43 @@ def test_api_classes_exist():
     assert callable(AIService.generate_summary)
 
 
-def test_health_check_endpoint():
+def test_health_check_endpoint(client):
     """Test that health check endpoint exists."""
-    # Disable IP restrictions for testing
-    os.environ['ENABLE_IP_RESTRICTIONS'] = 'false'
-    os.environ['ALLOWED_IPS'] = ''
-    
-    from app import app
-    
-    with app.test_client() as client:
-        response = client.get('/health')
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data['status'] == 'healthy'
+    response = client.get('/health')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['status'] == 'healthy'
 
 
-def test_home_page_loads():
+def test_home_page_loads(client):
     """Test that home page loads without database connection."""
-    # Disable IP restrictions for testing
-    os.environ['ENABLE_IP_RESTRICTIONS'] = 'false'
-    os.environ['ALLOWED_IPS'] = ''
-    
-    from app import app
-    
-    with app.test_client() as client:
-        response = client.get('/')
-        assert response.status_code == 200
-        assert b'Job Sight' in response.data
+    response = client.get('/')
+    assert response.status_code == 200
+    assert b'Job Sight' in response.data
 
 
-def test_register_page_loads():
+def test_register_page_loads(client):
     """Test that register page loads."""
-    # Disable IP restrictions for testing
-    os.environ['ENABLE_IP_RESTRICTIONS'] = 'false'
-    os.environ['ALLOWED_IPS'] = ''
-    
-    from app import app
-    
-    with app.test_client() as client:
-        response = client.get('/register')
-        assert response.status_code == 200
-        assert b'Create your account' in response.data
+    response = client.get('/register')
+    assert response.status_code == 200
+    assert b'Create your account' in response.data
 
 
-def test_login_page_loads():
+def test_login_page_loads(client):
     """Test that login page loads."""
-    # Disable IP restrictions for testing
-    os.environ['ENABLE_IP_RESTRICTIONS'] = 'false'
-    os.environ['ALLOWED_IPS'] = ''
-    
-    from app import app
-    
-    with app.test_client() as client:
-        response = client.get('/login')
-        assert response.status_code == 200
-        assert b'Sign in to your account' in response.data
+    response = client.get('/login')
+    assert response.status_code == 200
+    assert b'Sign in to your account' in response.data
 
 
-def test_static_files_exist():
+def test_static_files_exist(repo_files):
     """Test that static CSS file exists."""
-    import os
-    assert os.path.exists('static/styles.css'), "CSS file should exist"
+    assert 'static/styles.css' in repo_files, "CSS file should exist"
 
 
-def test_templates_exist():
+def test_templates_exist(repo_files):
     """Test that key templates exist."""
-    import os
-    key_templates = [
+    key_templates = {
         'templates/base.html',
         'templates/index.html',
         'templates/auth/login.html',
@@ -167,34 +148,32 @@ def test_templates_exist():
         'templates/results.html',
         'templates/profile.html',
         'templates/saved_jobs.html'
-    ]
-    
-    for template in key_templates:
-        assert os.path.exists(template), f"Template {template} should exist"
+    }
 
+    missing = key_templates - repo_files
+    assert not missing, f"Missing templates: {missing}"
 
-def test_requirements_file():
+
+def test_requirements_file(repo_files):
     """Test that requirements.txt contains necessary packages."""
-    import os
-    assert os.path.exists('requirements.txt'), "requirements.txt should exist"
-    
+    assert 'requirements.txt' in repo_files, "requirements.txt should exist"
+
+    # Parse pinned names once and compare as sets - substring checks would
+    # pass on the wrong package (e.g. 'Flask' matching only Flask-Login)
     with open('requirements.txt', 'r') as f:
-        requirements = f.read()
-    
+        packages = {line.split('==')[0].split('>=')[0].strip()
+                    for line in f if line.strip() and not line.startswith('#')}
+
     # Check for key dependencies
-    assert 'Flask' in requirements
-    assert 'Flask-SQLAlchemy' in requirements
-    assert 'Flask-Login' in requirements
-    assert 'pytest' in requirements
+    missing = {'Flask', 'Flask-SQLAlchemy', 'Flask-Login', 'pytest'} - packages
+    assert not missing, f"Missing requirements: {missing}"
 
 
-def test_dockerfile_exists():
+def test_dockerfile_exists(repo_files):
     """Test that Dockerfile exists."""
-    import os
-    assert os.path.exists('Dockerfile'), "Dockerfile should exist"
+    assert 'Dockerfile' in repo_files, "Dockerfile should exist"
 
 
-def test_ci_cd_workflow_exists():
+def test_ci_cd_workflow_exists(repo_files):
     """Test that CI/CD workflow exists."""
-    import os
-    assert os.path.exists('.github/workflows/ci.yml'), "CI/CD workflow should exist"
+    assert '.github/workflows/ci.yml' in repo_files, "CI/CD workflow should exist"